@@ -140,27 +140,32 @@ visualization = {
 
 docs = {**algorithms, **visualization}
 
+# the docstrings are constant, strip them once instead of for every parsed function
+_STRIPPED_DOCS = {k: v.strip() for k, v in docs.items()}
+
 
 # =========================================================================================================
 # Util for docstrings
 # =========================================================================================================
 
-def parse_doc_string(source, dest=None, other={}):
+# compiled once on import instead of on every call of parse_doc_string
+_CONTROL_WS = re.compile(r"[\n\t]+")
+_MULTI_WS = re.compile(r"\s+")
+_DEF = re.compile(r"\A\s*def\s+")
+
+
+def parse_doc_string(source, dest=None, other=None):
     if not Config.parse_custom_docs:
         return
 
     if dest is None:
         dest = source
 
-    D = {k: v.strip() for k, v in docs.items()}
-    
     doc = source.__doc__
-    
 
-    lines = inspect.getsource(source)
     if doc is not None:
-        
-        doc = doc.format(**{**D, **other})
+
+        doc = doc.format(**(_STRIPPED_DOCS if not other else {**_STRIPPED_DOCS, **other}))
 
         lines = inspect.getsource(source)
 
@@ -178,9 +183,9 @@ def parse_doc_string(source, dest=None, other={}):
                 cnt -= 1
 
         signature = lines[:i]
-        signature = re.sub(r"[\n\t]*", "", signature)
-        signature = re.sub(r"\s+", " ", signature)
-        signature = re.sub(r"def\s*", "", signature)
+        signature = _CONTROL_WS.sub("", signature)
+        signature = _MULTI_WS.sub(" ", signature)
+        signature = _DEF.sub("", signature)
         signature = signature.strip()
 
         if dest is not None:
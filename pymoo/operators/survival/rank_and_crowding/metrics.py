@@ -4,18 +4,22 @@ from pymoo.util.misc import find_duplicates
 from pymoo.util.function_loader import load_function
 
 
+CROWDING_FUNCTIONS = {
+    "cd": lambda: FunctionalDiversity(calc_crowding_distance, filter_out_duplicates=False),
+    "pcd": lambda: FunctionalDiversity(load_function("calc_pcd"), filter_out_duplicates=True),
+    "pruning-cd": lambda: FunctionalDiversity(load_function("calc_pcd"), filter_out_duplicates=True),
+    "ce": lambda: FunctionalDiversity(calc_crowding_entropy, filter_out_duplicates=True),
+    "mnn": lambda: FuncionalDiversityMNN(load_function("calc_mnn"), filter_out_duplicates=True),
+    "2nn": lambda: FuncionalDiversityMNN(load_function("calc_2nn"), filter_out_duplicates=True),
+}
+
+
 def get_crowding_function(label):
 
-    if label == "cd":
-        fun = FunctionalDiversity(calc_crowding_distance, filter_out_duplicates=False)
-    elif (label == "pcd") or (label == "pruning-cd"):
-        fun = FunctionalDiversity(load_function("calc_pcd"), filter_out_duplicates=True)
-    elif label == "ce":
-        fun = FunctionalDiversity(calc_crowding_entropy, filter_out_duplicates=True)
-    elif label == "mnn":
-        fun = FuncionalDiversityMNN(load_function("calc_mnn"), filter_out_duplicates=True)
-    elif label == "2nn":
-        fun = FuncionalDiversityMNN(load_function("calc_2nn"), filter_out_duplicates=True)
+    create = CROWDING_FUNCTIONS.get(label) if isinstance(label, str) else None
+
+    if create is not None:
+        fun = create()
     elif hasattr(label, "__call__"):
         fun = FunctionalDiversity(label, filter_out_duplicates=True)
     elif isinstance(label, CrowdingDiversity):
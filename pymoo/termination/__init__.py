@@ -1,23 +1,26 @@
+from difflib import get_close_matches
 
-def get_termination(name, *args, **kwargs):
-    from pymoo.termination.default import DefaultMultiObjectiveTermination, DefaultSingleObjectiveTermination
-    from pymoo.termination.max_eval import MaximumFunctionCallTermination
-    from pymoo.termination.max_gen import MaximumGenerationTermination
-    from pymoo.termination.max_time import TimeBasedTermination
-    from pymoo.termination.fmin import MinimumFunctionValueTermination
+from pymoo.util.function_loader import load_class
+
+TERMINATIONS = {
+    "n_eval": "pymoo.termination.max_eval:MaximumFunctionCallTermination",
+    "n_evals": "pymoo.termination.max_eval:MaximumFunctionCallTermination",
+    "n_gen": "pymoo.termination.max_gen:MaximumGenerationTermination",
+    "n_iter": "pymoo.termination.max_gen:MaximumGenerationTermination",
+    "fmin": "pymoo.termination.fmin:MinimumFunctionValueTermination",
+    "time": "pymoo.termination.max_time:TimeBasedTermination",
+    "soo": "pymoo.termination.default:DefaultSingleObjectiveTermination",
+    "moo": "pymoo.termination.default:DefaultMultiObjectiveTermination",
+}
 
-    TERMINATION = {
-        "n_eval": MaximumFunctionCallTermination,
-        "n_evals": MaximumFunctionCallTermination,
-        "n_gen": MaximumGenerationTermination,
-        "n_iter": MaximumGenerationTermination,
-        "fmin": MinimumFunctionValueTermination,
-        "time": TimeBasedTermination,
-        "soo": DefaultSingleObjectiveTermination,
-        "moo": DefaultMultiObjectiveTermination,
-    }
 
-    if name not in TERMINATION:
-        raise Exception("Termination not found.")
+def get_termination(name, *args, **kwargs):
+    path = TERMINATIONS.get(name)
+    if path is None:
+        msg = "Termination %s not found." % name
+        matches = get_close_matches(name, TERMINATIONS)
+        if matches:
+            msg += " Did you mean: %s?" % ", ".join(matches)
+        raise Exception(msg)
 
-    return TERMINATION[name](*args, **kwargs)
+    return load_class(path)(*args, **kwargs)
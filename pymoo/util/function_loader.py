@@ -1,8 +1,14 @@
 import importlib
+from collections import namedtuple
+from functools import lru_cache
 
 from pymoo.config import Config
 
+# the implementations available for a function, either the function itself or the module providing it
+Implementations = namedtuple("Implementations", ["python", "cython"])
 
+
+@lru_cache(maxsize=1)
 def get_functions():
     from pymoo.util.nds.fast_non_dominated_sort import fast_non_dominated_sort
     from pymoo.util.nds.efficient_non_dominated_sort import efficient_non_dominated_sort
@@ -20,42 +26,36 @@ def get_functions():
     from pymoo.util.pruning_cd import calc_pcd
 
     FUNCTIONS = {
-        "fast_non_dominated_sort": {
-            "python": fast_non_dominated_sort,
-            "cython": "pymoo.cython.non_dominated_sorting",
-        },
-        "efficient_non_dominated_sort": {
-            "python": efficient_non_dominated_sort,
-            "cython": "pymoo.cython.non_dominated_sorting",
-        },
-        "fast_best_order_sort": {
-            "python": None,
-            "cython": "pymoo.cython.non_dominated_sorting",
-        },
-        "tree_based_non_dominated_sort": {
-            "python": tree_based_non_dominated_sort,
-            "cython": "pymoo.cython.non_dominated_sorting",
-        },
-        "dominance_degree_non_dominated_sort": {
-            "python": dominance_degree_non_dominated_sort,
-            "cython": "pymoo.cython.non_dominated_sorting",
-        },
-        "calc_distance_to_weights": {
-            "python": calc_distance_to_weights,
-            "cython": "pymoo.cython.decomposition",
-        },
-        "calc_perpendicular_distance": {
-            "python": calc_perpendicular_distance,
-            "cython": "pymoo.cython.calc_perpendicular_distance",
-        },
-        "stochastic_ranking": {
-            "python": stochastic_ranking,
-            "cython": "pymoo.cython.stochastic_ranking",
-        },
-        "hv": {"python": hv, "cython": "pymoo.cython.hv"},
-        "calc_mnn": {"python": calc_mnn, "cython": "pymoo.cython.mnn"},
-        "calc_2nn": {"python": calc_2nn, "cython": "pymoo.cython.mnn"},
-        "calc_pcd": {"python": calc_pcd, "cython": "pymoo.cython.pruning_cd"},
+        "fast_non_dominated_sort": Implementations(
+            python=fast_non_dominated_sort,
+            cython="pymoo.cython.non_dominated_sorting",
+        ),
+        "efficient_non_dominated_sort": Implementations(
+            python=efficient_non_dominated_sort,
+            cython="pymoo.cython.non_dominated_sorting",
+        ),
+        "fast_best_order_sort": Implementations(python=None, cython="pymoo.cython.non_dominated_sorting"),
+        "tree_based_non_dominated_sort": Implementations(
+            python=tree_based_non_dominated_sort,
+            cython="pymoo.cython.non_dominated_sorting",
+        ),
+        "dominance_degree_non_dominated_sort": Implementations(
+            python=dominance_degree_non_dominated_sort,
+            cython="pymoo.cython.non_dominated_sorting",
+        ),
+        "calc_distance_to_weights": Implementations(
+            python=calc_distance_to_weights,
+            cython="pymoo.cython.decomposition",
+        ),
+        "calc_perpendicular_distance": Implementations(
+            python=calc_perpendicular_distance,
+            cython="pymoo.cython.calc_perpendicular_distance",
+        ),
+        "stochastic_ranking": Implementations(python=stochastic_ranking, cython="pymoo.cython.stochastic_ranking"),
+        "hv": Implementations(python=hv, cython="pymoo.cython.hv"),
+        "calc_mnn": Implementations(python=calc_mnn, cython="pymoo.cython.mnn"),
+        "calc_2nn": Implementations(python=calc_2nn, cython="pymoo.cython.mnn"),
+        "calc_pcd": Implementations(python=calc_pcd, cython="pymoo.cython.pruning_cd"),
     }
 
     return FUNCTIONS
@@ -97,13 +97,13 @@ class FunctionLoader:
         if mode == "auto":
             mode = "cython" if self.is_compiled else "python"
 
-        if func_name not in FUNCTIONS:
+        func = FUNCTIONS.get(func_name)
+        if func is None:
             raise Exception("Function %s not found: %s" % (func_name, FUNCTIONS.keys()))
 
-        func = FUNCTIONS[func_name]
-        if mode not in func:
+        if mode not in Implementations._fields:
             raise Exception("Module not available in %s." % mode)
-        func = func[mode]
+        func = getattr(func, mode)
 
         # either provide a function or a string to the module (used for cython)
         if not callable(func):
@@ -117,6 +117,13 @@ def load_function(func_name=None, _type="auto"):
     return FunctionLoader.get_instance().load(func_name, mode=_type)
 
 
+@lru_cache(maxsize=None)
+def load_class(path):
+    # resolves a "module:attribute" path and keeps the result for all further lookups
+    module, name = path.split(":")
+    return getattr(importlib.import_module(module), name)
+
+
 def is_compiled():
     try:
         from pymoo.cython.info import info
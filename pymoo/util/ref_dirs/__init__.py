@@ -1,24 +1,105 @@
-from pymoo.util.ref_dirs.energy import RieszEnergyReferenceDirectionFactory
-from pymoo.util.ref_dirs.energy_layer import LayerwiseRieszEnergyReferenceDirectionFactory
-from pymoo.util.ref_dirs.reduction import ReductionBasedReferenceDirectionFactory
-from pymoo.util.ref_dirs.incremental import IncrementalReferenceDirectionFactory
-from pymoo.util.reference_direction import MultiLayerReferenceDirectionFactory
+from difflib import get_close_matches
+from functools import lru_cache
+
+import numpy as np
+
+from pymoo.util.function_loader import load_class
+
+REFERENCE_DIRECTIONS = {
+    "uniform": "pymoo.util.reference_direction:UniformReferenceDirectionFactory",
+    "das-dennis": "pymoo.util.reference_direction:UniformReferenceDirectionFactory",
+    "energy": "pymoo.util.ref_dirs.energy:RieszEnergyReferenceDirectionFactory",
+    "multi-layer": "pymoo.util.reference_direction:MultiLayerReferenceDirectionFactory",
+    "layer-energy": "pymoo.util.ref_dirs.energy_layer:LayerwiseRieszEnergyReferenceDirectionFactory",
+    "reduction": "pymoo.util.ref_dirs.reduction:ReductionBasedReferenceDirectionFactory",
+    "incremental": "pymoo.util.ref_dirs.incremental:IncrementalReferenceDirectionFactory",
+}
+
+# the factories which create the same directions for the same arguments even without a seed
+DETERMINISTIC = {"uniform", "das-dennis", "incremental"}
+
+# the factories which are random but return the same directions if a seed is provided
+SEEDED = {"energy", "layer-energy", "reduction"}
+
+# the factories used to be imported eagerly here, keep them accessible as module attributes
+_FACTORIES = {
+    "RieszEnergyReferenceDirectionFactory": REFERENCE_DIRECTIONS["energy"],
+    "LayerwiseRieszEnergyReferenceDirectionFactory": REFERENCE_DIRECTIONS["layer-energy"],
+    "ReductionBasedReferenceDirectionFactory": REFERENCE_DIRECTIONS["reduction"],
+    "IncrementalReferenceDirectionFactory": REFERENCE_DIRECTIONS["incremental"],
+    "MultiLayerReferenceDirectionFactory": REFERENCE_DIRECTIONS["multi-layer"],
+}
+
+
+def __getattr__(name):
+    path = _FACTORIES.get(name)
+    if path is not None:
+        return load_class(path)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def get_reference_directions(name, *args, **kwargs):
-    from pymoo.util.reference_direction import UniformReferenceDirectionFactory
-
-    REF = {
-        "uniform": UniformReferenceDirectionFactory,
-        "das-dennis": UniformReferenceDirectionFactory,
-        "energy": RieszEnergyReferenceDirectionFactory,
-        "multi-layer": MultiLayerReferenceDirectionFactory,
-        "layer-energy": LayerwiseRieszEnergyReferenceDirectionFactory,
-        "reduction": ReductionBasedReferenceDirectionFactory,
-        "incremental": IncrementalReferenceDirectionFactory,
-    }
-
-    if name not in REF:
-        raise Exception("Reference directions factory not found.")
-
-    return REF[name](*args, **kwargs)()
+    """
+    Creates the reference directions of the factory registered as `name`.
+
+    The directions of the deterministic factories (see `DETERMINISTIC`) and of the random ones called with a `seed`
+    (see `SEEDED`) only depend on the arguments. These results are kept in a cache of limited size and a copy is
+    returned. If a seed is provided, the global random state left behind by the computation is restored on a cache
+    hit, so the code following the call behaves as if the directions were computed again. Calls passing a
+    `callback` or `verbose=True` are always executed.
+    """
+    path = REFERENCE_DIRECTIONS.get(name)
+    if path is None:
+        msg = "Reference directions factory %s not found." % name
+        matches = get_close_matches(name, REFERENCE_DIRECTIONS)
+        if matches:
+            msg += " Did you mean: %s?" % ", ".join(matches)
+        raise Exception(msg)
+
+    key = _cache_key(name, args, kwargs)
+    if key is None:
+        return load_class(path)(*args, **kwargs)()
+
+    ref_dirs, random_state = _cached_reference_directions(*key)
+    if random_state is not None:
+        np.random.set_state(random_state)
+
+    return ref_dirs.copy()
+
+
+def _cache_key(name, args, kwargs):
+    seed = kwargs.get("seed")
+
+    if not (name in DETERMINISTIC or (name in SEEDED and seed is not None)):
+        return None
+
+    # a callback or verbose output is expected on every call, a tuple is returned with additional information
+    if kwargs.get("callback") is not None or kwargs.get("verbose", False) or kwargs.get("return_as_tuple", False):
+        return None
+
+    # the type is part of the key because 12, 12.0 and True are equal but not interchangeable as arguments
+    key = (name,
+           tuple((type(v), v) for v in args),
+           tuple((k, type(v), v) for k, v in sorted(kwargs.items())))
+
+    # arguments such as numpy arrays can not be used as a key
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+@lru_cache(maxsize=64)
+def _cached_reference_directions(name, args, kwargs):
+    args = tuple(v for _, v in args)
+    kwargs = {k: v for k, _, v in kwargs}
+
+    ref_dirs = load_class(REFERENCE_DIRECTIONS[name])(*args, **kwargs)()
+    ref_dirs.flags.writeable = False
+
+    # seeding the factory sets the global random state, keep it to restore it on a cache hit
+    random_state = np.random.get_state() if kwargs.get("seed") is not None else None
+
+    return ref_dirs, random_state
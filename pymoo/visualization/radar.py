@@ -12,7 +12,7 @@ class Radar(Plot):
     def __init__(self,
                  normalize_each_objective=True,
                  n_partitions=3,
-                 point_style={},
+                 point_style=None,
                  **kwargs):
 
         """
@@ -43,7 +43,11 @@ class Radar(Plot):
         self.normalize_each_objective = normalize_each_objective
         self.n_partitions = n_partitions
 
-        self.point_style = point_style
+        # copy the style so the defaults below are never written into the caller's dict
+        if point_style is None:
+            self.point_style = {}
+        else:
+            self.point_style = point_style.copy()
         set_if_none_from_tuples(self.point_style, ("s", 15))
 
         set_if_none_from_tuples(self.axis_style, ("color", "black"), ("linewidth", 0.5), ("alpha", 0.75))
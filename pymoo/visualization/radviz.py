@@ -7,7 +7,7 @@ from pymoo.visualization.util import plot_circle, plot_radar_line, plot_axis_lab
 
 class Radviz(Plot):
 
-    def __init__(self, endpoint_style={}, **kwargs):
+    def __init__(self, endpoint_style=None, **kwargs):
         """
 
         Radviz Plot
@@ -36,7 +36,11 @@ class Radviz(Plot):
         # set the default axis style
         set_if_none_from_tuples(self.axis_style, ("color", "black"), ("linewidth", 1), ("alpha", 0.75))
 
-        self.endpoint_style = endpoint_style
+        # copy the style so the defaults below are never written into the caller's dict
+        if endpoint_style is None:
+            self.endpoint_style = {}
+        else:
+            self.endpoint_style = endpoint_style.copy()
         set_if_none_from_tuples(self.endpoint_style, ("color", "black"), ("s", 70), ("alpha", 0.3))
 
     def _do(self):
@@ -0,0 +1,18 @@
+from pymoo.config import Config
+from pymoo.docs import parse_doc_string
+
+
+def test_parse_doc_string_keeps_def_inside_signature(monkeypatch):
+    monkeypatch.setattr(Config, "parse_custom_docs", True)
+
+    def func(a, default_value=1,
+             undefined=None):
+        """
+        pop_size : {pop_size}
+        """
+
+    parse_doc_string(func)
+
+    signature, doc = func.__doc__.split("\n", 1)
+    assert signature == "func(a, default_value=1, undefined=None)"
+    assert "The population sized used by the algorithm." in doc
@@ -0,0 +1,17 @@
+import pytest
+
+from pymoo.visualization.radar import Radar
+from pymoo.visualization.radviz import Radviz
+
+
+@pytest.mark.parametrize('clazz, arg, attr', [(Radar, "point_style", "point_style"),
+                                               (Radviz, "endpoint_style", "endpoint_style")])
+def test_style_defaults_do_not_leak(clazz, arg, attr):
+    d = {"color": "red"}
+    plot = clazz(**{arg: d})
+    assert d == {"color": "red"}
+    assert getattr(plot, attr) is not d
+
+    # a style set on one instance must not show up in the default style of the next one
+    getattr(clazz(), attr)["color"] = "blue"
+    assert getattr(clazz(), attr).get("color") != "blue"
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
-from pymoo.util.ref_dirs import get_reference_directions
+from pymoo.util.ref_dirs import get_reference_directions, _cached_reference_directions, \
+    RieszEnergyReferenceDirectionFactory
 from pymoo.util.reference_direction import sample_on_unit_simplex
 
 
@@ -60,3 +62,52 @@ def test_unit_simplex_sampling():
     assert len(sample_on_unit_simplex(n_points, n_dim, unit_simplex_mapping="das-dennis")), 990
     assert len(sample_on_unit_simplex(n_points, n_dim, unit_simplex_mapping="sum")), 1000
     assert len(sample_on_unit_simplex(n_points, n_dim, unit_simplex_mapping="kraemer")), 1000
+
+
+def test_cached_ref_dirs_are_not_shared():
+    a = get_reference_directions("das-dennis", 3, n_partitions=12)
+    a[:] = 0.0
+
+    b = get_reference_directions("das-dennis", 3, n_partitions=12)
+    assert b is not a
+    assert b.sum() > 0
+    assert b.flags.writeable
+
+
+def test_das_dennis_is_cached():
+    get_reference_directions("das-dennis", 3, n_partitions=13)
+    hits = _cached_reference_directions.cache_info().hits
+
+    get_reference_directions("das-dennis", 3, n_partitions=13)
+    assert _cached_reference_directions.cache_info().hits == hits + 1
+
+
+def test_seeded_call_still_reseeds_random_state():
+    for _ in range(2):
+        get_reference_directions("das-dennis", 3, n_partitions=12, seed=1)
+        a = np.random.rand()
+
+        get_reference_directions("energy", 3, n_points=12, seed=1)
+        b = np.random.rand()
+
+        assert a == b
+
+
+def test_seeded_energy_is_cached():
+    expected = RieszEnergyReferenceDirectionFactory(3, n_points=12, seed=2).do()
+    expected_state = np.random.rand(5)
+
+    get_reference_directions("energy", 3, n_points=12, seed=2)
+    hits = _cached_reference_directions.cache_info().hits
+
+    ref_dirs = get_reference_directions("energy", 3, n_points=12, seed=2)
+    assert _cached_reference_directions.cache_info().hits == hits + 1
+    assert np.array_equal(ref_dirs, expected)
+    assert np.array_equal(np.random.rand(5), expected_state)
+
+
+def test_cache_does_not_hide_invalid_argument_types():
+    get_reference_directions("das-dennis", 3, n_partitions=12)
+
+    with pytest.raises(TypeError):
+        get_reference_directions("das-dennis", 3, n_partitions=12.0)